@@ -1,11 +1,17 @@
 # maze_game.py
 
 import os  # For file and path operations (leaderboard storage)
+import sys  # For reporting non-fatal errors on stderr
+import zipfile  # For recognizing a corrupt maze cache file
 import json  # For reading and writing JSON leaderboard data
+import heapq  # For picking the top leaderboard scores without a full sort
 import random  # For randomizing maze generation
-import time  # For animation timing and delays
+import time  # For animation frame timing
+import math  # For rounding frame waits up to whole milliseconds
+import io  # In-memory buffers for the pre-rendered maze images
+import numpy as np  # Dense uint8 grids for the mazes
 import PySimpleGUI as sg  # GUI library for drawing and events
-import keyboard  # For detecting real-time keyboard input
+from PIL import Image, ImageDraw  # For pre-rendering the static maze walls
 
 #CONFIGURATION
 CELL_SIZE         = 20     # Size of each maze cell in pixels
@@ -13,96 +19,261 @@ MAX_FAILS_PER_MAP = 10     # Maximum number of failed attempts allowed per maze
 NUM_MAPS          = 5      # Total number of different mazes to play through
 MAZE_WIDTH        = 41     # Maze width in cells (must be odd for proper generation)
 MAZE_HEIGHT       = 31     # Maze height in cells (must be odd for proper generation)
+MAZE_POOL_SIZE    = 50     # Number of mazes kept in the on-disk cache to pick from
+MAZE_CACHE_FILE   = 'mazes.npz'  # Cached maze pool, regenerated if missing
 
-#MAZE GENERATOR (perfect maze via recursive backtracker)
-def generate_maze(w, h):
+# Row and column deltas for each movement key
+MOVE_DIRS = {'w': (-1, 0), 's': (1, 0), 'a': (0, -1), 'd': (0, 1)}
+
+#MAZE GENERATOR (perfect maze via iterative backtracker)
+_DIR_ROWS = np.array([0, 0, 2, -2], dtype=np.int32)  # Row offset of each carve direction
+_DIR_COLS = np.array([2, -2, 0, 0], dtype=np.int32)  # Column offset of each carve direction
+
+
+def _generate_maze_nb(w, h, seed):
+    # Kernel compiled with Numba on first use; see generate_maze
+    np.random.seed(seed)
     # Initialize grid full of walls (1 represents wall, 0 will represent path)
-    grid = [[1] * w for _ in range(h)]
+    grid = np.ones((h, w), np.uint8)
+    # Preallocated stack of cells still being explored, with its current length
+    stack = np.empty((w * h, 2), np.int32)
+    dirs = np.empty(4, np.int32)
+    for i in range(4):
+        dirs[i] = i
+
+    # Start carving from the entrance at (1,1)
+    grid[1, 1] = 0
+    stack[0, 0] = 1
+    stack[0, 1] = 1
+    top = 1
+    while top > 0:
+        r = stack[top - 1, 0]  # Continue from the most recently carved cell
+        c = stack[top - 1, 1]
+        # Fisher-Yates shuffle of the direction order for unpredictability
+        for i in range(3, 0, -1):
+            j = np.random.randint(0, i + 1)
+            dirs[i], dirs[j] = dirs[j], dirs[i]
+        carved = False
+        for k in range(4):
+            dr = _DIR_ROWS[dirs[k]]
+            dc = _DIR_COLS[dirs[k]]
+            nr, nc = r + dr, c + dc  # Coordinates two cells away
+            # Check if the target is inside bounds and still a wall
+            if 0 < nr < h-1 and 0 < nc < w-1 and grid[nr, nc] == 1:
+                # Carve the intermediate cell (one step in direction) and the target
+                grid[r + dr // 2, c + dc // 2] = 0
+                grid[nr, nc] = 0
+                stack[top, 0] = nr  # Continue carving from the new cell
+                stack[top, 1] = nc
+                top += 1
+                carved = True
+                break
+        if not carved:
+            top -= 1  # No unvisited neighbors left: backtrack
+
+    # Ensure the exit cell is open
+    grid[h-2, w-2] = 0
+    return grid
+
+
+def _generate_maze_py(w, h):
+    # Pure-Python fallback when Numba isn't installed
+    # Initialize flat grid full of walls (1 represents wall, 0 will represent path)
+    grid = bytearray([1]) * (w * h)
 
-    def carve(r, c):
-        # Mark current cell as a path
-        grid[r][c] = 0
+    # Start carving from the entrance at (1,1); the stack holds the cells still being explored
+    stack = [(1, 1)]
+    grid[w + 1] = 0
+    while stack:
+        r, c = stack[-1]  # Continue from the most recently carved cell
         # Define possible carve directions: two cells at a time
         dirs = [(0, 2), (0, -2), (2, 0), (-2, 0)]
         random.shuffle(dirs)  # Randomize direction order for unpredictability
         for dr, dc in dirs:
             nr, nc = r + dr, c + dc  # Coordinates two cells away
             # Check if the target is inside bounds and still a wall
-            if 0 < nr < h-1 and 0 < nc < w-1 and grid[nr][nc] == 1:
-                # Carve the intermediate cell (one step in direction)
-                grid[r + dr // 2][c + dc // 2] = 0
-                # Recurse into the next cell to continue carving
-                carve(nr, nc)
+            if 0 < nr < h-1 and 0 < nc < w-1 and grid[nr * w + nc] == 1:
+                # Carve the intermediate cell (one step in direction) and the target
+                grid[(r + dr // 2) * w + (c + dc // 2)] = 0
+                grid[nr * w + nc] = 0
+                stack.append((nr, nc))  # Continue carving from the new cell
+                break
+        else:
+            stack.pop()  # No unvisited neighbors left: backtrack
 
-    # Start carving from the entrance at (1,1)
-    carve(1, 1)
     # Ensure the exit cell is open
-    grid[h-2][w-2] = 0
-    return grid
+    grid[(h-2) * w + (w-2)] = 0
+    return np.frombuffer(grid, np.uint8).reshape(h, w)
 
-# Pre-generate all mazes for the game
-mazes   = [generate_maze(MAZE_WIDTH, MAZE_HEIGHT) for _ in range(NUM_MAPS)]
+
+_maze_kernel = None  # Compiled generator, False if Numba is unavailable; None until first use
+
+
+def generate_maze(w, h):
+    global _maze_kernel
+    if _maze_kernel is None:
+        # Import Numba only when mazes actually have to be generated
+        try:
+            from numba import njit
+        except ImportError:
+            _maze_kernel = False
+        else:
+            _maze_kernel = njit(cache=True)(_generate_maze_nb)
+    if not _maze_kernel:
+        return _generate_maze_py(w, h)
+    # Seed the compiled generator from Python's RNG so each maze differs
+    return _maze_kernel(w, h, random.randrange(2**31))
+
+
+def find_wall_runs(maze):
+    # Run-length encode each row into horizontal wall spans (row, first col, col past the end)
+    runs = []
+    for r, row in enumerate(maze):
+        edges = np.diff(np.pad(row.astype(np.int8), 1))  # +1 where a run starts, -1 past its end
+        starts = np.flatnonzero(edges == 1).tolist()
+        ends   = np.flatnonzero(edges == -1).tolist()
+        runs.extend((r, c_start, c_end) for c_start, c_end in zip(starts, ends))
+    return runs
+
+# Load the cached pool of mazes, regenerating it if missing or built for another size
+maze_pool = None
+if os.path.exists(MAZE_CACHE_FILE):
+    try:
+        with np.load(MAZE_CACHE_FILE) as data:
+            maze_pool = data['mazes']
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        maze_pool = None  # Unreadable cache: fall through and rebuild it
+if maze_pool is None or maze_pool.shape != (MAZE_POOL_SIZE, MAZE_HEIGHT, MAZE_WIDTH):
+    maze_pool = np.stack([generate_maze(MAZE_WIDTH, MAZE_HEIGHT) for _ in range(MAZE_POOL_SIZE)])
+    # Write to a temp file and swap it in so a crash can't leave a corrupt cache
+    tmp = MAZE_CACHE_FILE + '.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            np.savez_compressed(f, mazes=maze_pool)
+        os.replace(tmp, MAZE_CACHE_FILE)
+    except OSError as err:
+        # The cache is only a speed-up; play on with the freshly generated pool
+        print(f'Could not save maze cache: {err}', file=sys.stderr)
+
+# Pick this game's mazes from the pool as one dense (map, row, col) array
+mazes   = maze_pool[random.sample(range(MAZE_POOL_SIZE), NUM_MAPS)]
 HEIGHT  = MAZE_HEIGHT  # Alias for easier reference
 WIDTH   = MAZE_WIDTH
+maze_bytes = [maze.tobytes() for maze in mazes]  # Row-major copies for fast per-cell lookups
+wall_runs = [find_wall_runs(maze) for maze in mazes]  # Precomputed wall spans per map
 start_pos = (1, 1)  # Starting cell in maze coordinates (row, col)
 exit_pos  = (HEIGHT - 2, WIDTH - 2)  # Exit cell near bottom-right
 
+# Pixel centre of every cell for drawing, precomputed once: px_lut[r, c] = (x, y)
+px_lut = np.empty((HEIGHT, WIDTH, 2), np.float32)
+px_lut[:, :, 0] = np.arange(WIDTH) * CELL_SIZE + CELL_SIZE / 2
+px_lut[:, :, 1] = ((HEIGHT - 1 - np.arange(HEIGHT)) * CELL_SIZE + CELL_SIZE / 2)[:, None]
+
 #HELPER FUNCTIONS
-def grid_to_pixel(r, c):
-    # Convert maze grid coordinates to pixel coordinates for drawing
-    x = c * CELL_SIZE + CELL_SIZE / 2
-    y = (HEIGHT - 1 - r) * CELL_SIZE + CELL_SIZE / 2
-    return x, y
-
-
-def animate_move(graph, fig, old_xy, new_xy, steps=8, delay=0.02):
-    """Smoothly animate a move from old_xy to new_xy in given steps."""
-    dx = (new_xy[0] - old_xy[0]) / steps  # Delta x per step
-    dy = (new_xy[1] - old_xy[1]) / steps  # Delta y per step
-    for _ in range(steps):
+def at(m, r, c):
+    # Read cell (r, c) of a row-major maze stored as bytes (1 = wall, 0 = path)
+    return m[r * WIDTH + c]
+
+
+def render_maze_png(runs, background):
+    # Paint the static walls of one maze into a PNG so redraws blit a single image
+    img = Image.new('RGB', (WIDTH * CELL_SIZE, HEIGHT * CELL_SIZE), background)
+    draw = ImageDraw.Draw(img)
+    for r, c_start, c_end in runs:
+        # PIL rows grow downward and rectangle corners are inclusive
+        draw.rectangle(
+            (c_start * CELL_SIZE, r * CELL_SIZE, c_end * CELL_SIZE - 1, (r + 1) * CELL_SIZE - 1),
+            fill='black'
+        )
+    buf = io.BytesIO()
+    img.save(buf, format='PNG')
+    return buf.getvalue()
+
+
+def path_to_pixels(path):
+    # Look up the pixel centres of a whole path of (row, col) cells at once
+    cells = np.array(path)
+    return px_lut[cells[:, 0], cells[:, 1]].tolist()
+
+
+def animate_move(graph, fig, old_xy, new_xy, duration=0.16, frames=None):
+    """Smoothly animate a move from old_xy to new_xy over duration seconds at up to 60fps.
+
+    Returns False if the window was closed during the animation.
+    """
+    if frames is None:
+        frames = max(1, int(duration * 60))  # One step per visible frame
+    dx = (new_xy[0] - old_xy[0]) / frames  # Delta x per frame
+    dy = (new_xy[1] - old_xy[1]) / frames  # Delta y per frame
+    deadline = time.perf_counter()
+    for _ in range(frames):
         graph.MoveFigure(fig, dx, dy)  # Move the drawn figure
-        window.refresh()               # Refresh GUI to show movement
-        time.sleep(delay)              # Pause briefly for animation effect
-
+        # Wait until this frame's deadline inside window.read so the GUI stays responsive;
+        # other events (e.g. key auto-repeat) end a read early, so keep reading until it passes
+        deadline += duration / frames
+        while True:
+            remaining = max(0, deadline - time.perf_counter())
+            # Round up: a zero timeout is a non-blocking read and would spin until the deadline
+            event, _ = window.read(timeout=math.ceil(remaining * 1000))
+            if event == sg.WIN_CLOSED:
+                return False
+            # Movement keys pressed mid-move are dropped
+            if time.perf_counter() >= deadline:
+                break
+    return True
 
-def draw_map(graph, map_idx, failed_paths):
-    # Clear previous drawings
-    graph.Erase()
-    maze = mazes[map_idx]  # Select the current maze
-
-    # Draw walls as black rectangles
-    for r in range(HEIGHT):
-        for c in range(WIDTH):
-            if maze[r][c] == 1:  # If cell is a wall
-                x1, y1 = c * CELL_SIZE, (HEIGHT - 1 - r) * CELL_SIZE
-                graph.DrawRectangle(
-                    (x1, y1),
-                    (x1 + CELL_SIZE, y1 + CELL_SIZE),
-                    fill_color='black',
-                    line_color='black'
-                )
 
-    # Overlay any previously failed paths in red
-    for path in failed_paths[map_idx]:
-        pts = [grid_to_pixel(r, c) for r, c in path]
-        for i in range(len(pts) - 1):
-            graph.DrawLine(pts[i], pts[i+1], color='red', width=2)
+def clear_figures(graph, fig_ids):
+    # Remove the given figures from the canvas and forget their IDs
+    for fig in fig_ids:
+        graph.DeleteFigure(fig)
+    fig_ids.clear()
 
-    # Draw exit flag at exit position
-    ex, ey = grid_to_pixel(*exit_pos)
-    graph.DrawText('🏁', (ex, ey), font=('Any', int(CELL_SIZE * 0.7)))
 
-    # Draw player start as a blue circle
+def place_player(graph):
+    # Replace the player figure with a blue circle at the start cell
+    clear_figures(graph, dynamic_fig_ids)
     pr, pc = start_pos
-    px, py = grid_to_pixel(pr, pc)
+    px, py = px_lut[pr, pc].tolist()
     player_fig = graph.DrawCircle((px, py), CELL_SIZE * 0.3, fill_color='blue')
+    dynamic_fig_ids.append(player_fig)
 
     # Return initial player position and the figure for animation
     return pr, pc, player_fig
 
+
+def draw_map(graph, map_idx, failed_paths):
+    # Remove only the figures of the previously shown map
+    clear_figures(graph, static_fig_ids)
+    for fig_ids in failed_path_fig_ids:
+        clear_figures(graph, fig_ids)
+
+    # Blit the pre-rendered walls, anchored at the top-left corner of the graph
+    static_fig_ids.append(
+        graph.DrawImage(data=maze_png[map_idx], location=(0, HEIGHT * CELL_SIZE))
+    )
+
+    # Overlay any previously failed paths in red
+    for _, segments in failed_paths[map_idx]:
+        for p0, p1 in segments:
+            failed_path_fig_ids[map_idx].append(
+                graph.DrawLine(p0, p1, color='red', width=2)
+            )
+
+    # Draw exit flag at exit position
+    ex, ey = px_lut[exit_pos].tolist()
+    static_fig_ids.append(
+        graph.DrawText('🏁', (ex, ey), font=('Any', int(CELL_SIZE * 0.7)))
+    )
+
+    # Draw player start on top of the map
+    return place_player(graph)
+
 #SETUP GUI
 username = sg.popup_get_text('Enter your username:', 'Maze Game') or 'Anonymous'
 sg.theme('DarkBlue3')  # Set window theme
+# Pre-render each maze's walls over the theme background
+maze_png = [render_maze_png(runs, sg.theme_background_color()) for runs in wall_runs]
 
 graph = sg.Graph(
     canvas_size=(WIDTH * CELL_SIZE, HEIGHT * CELL_SIZE),
@@ -113,84 +284,96 @@ graph = sg.Graph(
 )
 status = sg.Text('', key='-STATUS-')  # Text element for status updates
 layout = [[status], [graph]]
-window = sg.Window('Maze Game', layout, return_keyboard_events=True, finalize=True)
+window = sg.Window('Maze Game', layout, finalize=True)
+# Report key presses (including auto-repeat while held); tk details are in window.user_bind_event
+window.bind('<KeyPress>', '-KEY-DOWN-')
 
 #INITIAL GAME STATE
 map_index      = 0                             # Current maze index
 fail_counts    = [0] * NUM_MAPS                # Fail count per maze
-failed_paths   = [[] for _ in range(NUM_MAPS)] # Store paths that led to dead ends
+failed_paths   = [[] for _ in range(NUM_MAPS)] # (path, pixel segments) that led to dead ends
 total_attempts = 0                             # Total move attempts across game
+last_status_tuple = None                       # Progress last shown in the status bar
+
+# Canvas figure IDs, kept so redraws only touch what changed
+static_fig_ids      = []                              # Maze image and exit flag
+dynamic_fig_ids     = []                              # Player figure
+failed_path_fig_ids = [[] for _ in range(NUM_MAPS)]   # Red failed-path lines per map
 
 # Draw the first maze and place the player
 player_row, player_col, player_fig = draw_map(graph, map_index, failed_paths)
 current_path = [start_pos]  # Track current path for dead-end detection
+current_path_set = {start_pos}  # Same cells as a set for O(1) backtracking checks
 
 #MAIN EVENT LOOP
 while True:
-    # Update status bar with current progress
-    window['-STATUS-'].update(
-        f'Map {map_index+1}/{NUM_MAPS}   '
-        f'Fails {fail_counts[map_index]}/{MAX_FAILS_PER_MAP}   '
-        f'Total Attempts {total_attempts}'
-    )
-
-    event, _ = window.read(timeout=100)
+    # Update status bar only when the progress it shows has changed
+    status_tuple = (map_index, fail_counts[map_index], total_attempts)
+    if status_tuple != last_status_tuple:
+        last_status_tuple = status_tuple
+        window['-STATUS-'].update(
+            f'Map {map_index+1}/{NUM_MAPS}   '
+            f'Fails {fail_counts[map_index]}/{MAX_FAILS_PER_MAP}   '
+            f'Total Attempts {total_attempts}'
+        )
+
+    event, _ = window.read()  # Block until a key press or window event arrives
     if event in (sg.WIN_CLOSED, 'Exit'):
         break  # Exit the game loop if window is closed or "Exit" pressed
 
-    # Detect sprint (shift key)
-    sprint = keyboard.is_pressed('shift')
+    if event != '-KEY-DOWN-':
+        continue  # Only key presses drive the game
+    key_event = window.user_bind_event
+
+    # Detect sprint (shift held during this key press; bit 0x1 of the modifier state)
+    sprint = bool(key_event.state & 0x1)
 
-    # Handle movement keys (WASD)
-    dr = dc = 0  # Row and column deltas
-    if keyboard.is_pressed('w'): dr = -1
-    elif keyboard.is_pressed('s'): dr = +1
-    elif keyboard.is_pressed('a'): dc = -1
-    elif keyboard.is_pressed('d'): dc = +1
+    # Handle movement keys (WASD, upper case while shift is held)
+    dr, dc = MOVE_DIRS.get(key_event.keysym.lower(), (0, 0))  # Row and column deltas
 
     if dr or dc:
         new_r = player_row + dr
         new_c = player_col + dc
-        maze = mazes[map_index]
+        maze = maze_bytes[map_index]
 
         # Prevent backtracking onto the immediate previous cell
-        if (new_r, new_c) in current_path:
-            time.sleep(0.01 if sprint else 0.05)
+        if (new_r, new_c) in current_path_set:
             continue
 
         # Check if new position is within bounds and on a path
-        if 0 <= new_r < HEIGHT and 0 <= new_c < WIDTH and maze[new_r][new_c] == 0:
-            old_xy = grid_to_pixel(player_row, player_col)
+        if 0 <= new_r < HEIGHT and 0 <= new_c < WIDTH and at(maze, new_r, new_c) == 0:
+            old_xy = px_lut[player_row, player_col].tolist()
             player_row, player_col = new_r, new_c
-            new_xy = grid_to_pixel(player_row, player_col)
+            new_xy = px_lut[player_row, player_col].tolist()
 
             # Animate movement (faster if sprinting)
             if sprint:
-                animate_move(graph, player_fig, old_xy, new_xy, steps=4, delay=0.005)
+                still_open = animate_move(graph, player_fig, old_xy, new_xy, duration=0.02, frames=1)
             else:
-                animate_move(graph, player_fig, old_xy, new_xy)
+                still_open = animate_move(graph, player_fig, old_xy, new_xy)
+            if not still_open:
+                break  # Window was closed mid-move
 
             # Record this step in the current path
             current_path.append((player_row, player_col))
-
-            # Check for dead-end: count open neighbors
-            nbrs = [
-                (player_row-1, player_col),
-                (player_row+1, player_col),
-                (player_row, player_col-1),
-                (player_row, player_col+1)
-            ]
-            free = [
-                (r, c) for r, c in nbrs
-                if 0 <= r < HEIGHT and 0 <= c < WIDTH and maze[r][c] == 0
-            ]
+            current_path_set.add((player_row, player_col))
+
+            # Check for dead-end: count open neighbors (path cells never touch the border)
+            open_nbrs = (4
+                - at(maze, player_row-1, player_col)
+                - at(maze, player_row+1, player_col)
+                - at(maze, player_row, player_col-1)
+                - at(maze, player_row, player_col+1))
             # Dead-end if no more than one open neighbor and not at exit
-            if len(free) <= 1 and (player_row, player_col) != exit_pos:
-                # Save the failed path for display
-                failed_paths[map_index].append(list(current_path))
-                pts = [grid_to_pixel(r, c) for r, c in current_path]
-                for i in range(len(pts) - 1):
-                    graph.DrawLine(pts[i], pts[i+1], color='red', width=2)
+            if open_nbrs <= 1 and (player_row, player_col) != exit_pos:
+                # Save the failed path and its pixel-space line segments for display
+                pts = path_to_pixels(current_path)
+                segments = list(zip(pts[:-1], pts[1:]))
+                failed_paths[map_index].append((list(current_path), segments))
+                for p0, p1 in segments:
+                    failed_path_fig_ids[map_index].append(
+                        graph.DrawLine(p0, p1, color='red', width=2)
+                    )
 
                 sg.popup('You hit a dead end and were eaten by trolls!', title='Dead End')
                 fail_counts[map_index] += 1
@@ -204,12 +387,15 @@ while True:
                     fail_counts    = [0] * NUM_MAPS
                     failed_paths   = [[] for _ in range(NUM_MAPS)]
                     total_attempts = 0
+                    # Failed paths were wiped, so repaint the first map from scratch
+                    player_row, player_col, player_fig = draw_map(graph, map_index, failed_paths)
+                else:
+                    # Walls and failed paths stay on the canvas; only the player moves back
+                    player_row, player_col, player_fig = place_player(graph)
 
-                # Reset player to start of current map
-                graph.DeleteFigure(player_fig)
-                player_row, player_col = start_pos
+                # Restart path tracking from the start of the map
                 current_path = [start_pos]
-                player_row, player_col, player_fig = draw_map(graph, map_index, failed_paths)
+                current_path_set = {start_pos}
 
         # Check if player reached exit
         elif (player_row, player_col) == exit_pos:
@@ -221,25 +407,28 @@ while True:
                 sg.popup(f'🏆 You Win! 🏆\nTotal attempts: {total_attempts}', title='Victory')
                 # Load or initialize leaderboard file
                 LB_FILE = 'leaderboard.json'
-                lb = json.load(open(LB_FILE)) if os.path.exists(LB_FILE) else {}
+                lb = {}
+                if os.path.exists(LB_FILE):
+                    with open(LB_FILE) as f:
+                        lb = json.load(f)
                 # Update leaderboard if new high score
                 if username not in lb or total_attempts < lb[username]:
                     lb[username] = total_attempts
-                    json.dump(lb, open(LB_FILE, 'w'), indent=2)
+                    # Write to a temp file and swap it in so a crash can't corrupt the board
+                    tmp = LB_FILE + '.tmp'
+                    with open(tmp, 'w') as f:
+                        json.dump(lb, f, separators=(',', ':'))
+                    os.replace(tmp, LB_FILE)
                 # Display top 10 scores
-                top = sorted(lb.items(), key=lambda x: x[1])[:10]
+                top = heapq.nsmallest(10, lb.items(), key=lambda x: x[1])
                 msg = '\n'.join(f'{i+1}. {u}: {s} attempts' for i, (u, s) in enumerate(top))
                 sg.popup_scrolled(msg, title='🏅 Leaderboard')
                 break
 
             # Otherwise, move to next map
-            graph.DeleteFigure(player_fig)
-            player_row, player_col = start_pos
             current_path = [start_pos]
+            current_path_set = {start_pos}
             player_row, player_col, player_fig = draw_map(graph, map_index, failed_paths)
 
-        # Add a small delay to control movement speed
-        time.sleep(0.01 if sprint else 0.05)
-
 # Close the window and exit cleanly
 window.close()